@@ -65,40 +65,44 @@ load_env() {
 check_requirements() {
     echo -e "${BLUE}Checking requirements...${NC}"
     
-    # Check for Node.js
-    if ! command -v node &> /dev/null; then
-        echo -e "${RED}Error: Node.js is required but not installed.${NC}"
-        echo -e "Please install Node.js v20 or higher: https://nodejs.org/"
-        exit 1
-    fi
+    # Images with the toolchain already installed can skip the tool probes
+    if [ "$MCP_SKIP_REQUIREMENTS_CHECK" != "1" ]; then
+        # Check for Node.js
+        if ! command -v node &> /dev/null; then
+            echo -e "${RED}Error: Node.js is required but not installed.${NC}"
+            echo -e "Please install Node.js v20 or higher: https://nodejs.org/"
+            exit 1
+        fi
     
-    # Check Node.js version
-    node_version=$(node -v | cut -d'v' -f2)
-    node_major=$(echo "$node_version" | cut -d'.' -f1)
-    if [ "$node_major" -lt 20 ]; then
-        echo -e "${RED}Error: Node.js v20 or higher is required.${NC}"
-        echo -e "Current version: v${node_version}"
-        echo -e "Please upgrade Node.js: https://nodejs.org/"
-        exit 1
-    fi
+        # Check Node.js version
+        node_version=$(node -v)
+        node_version="${node_version#v}"
+        node_major="${node_version%%.*}"
+        if [ "$node_major" -lt 20 ]; then
+            echo -e "${RED}Error: Node.js v20 or higher is required.${NC}"
+            echo -e "Current version: v${node_version}"
+            echo -e "Please upgrade Node.js: https://nodejs.org/"
+            exit 1
+        fi
     
-    # Check for npx
-    if ! command -v npx &> /dev/null; then
-        echo -e "${RED}Error: npx is required but not installed.${NC}"
-        echo -e "Please install npm to get npx: https://nodejs.org/"
-        exit 1
-    fi
+        # Check for npx
+        if ! command -v npx &> /dev/null; then
+            echo -e "${RED}Error: npx is required but not installed.${NC}"
+            echo -e "Please install npm to get npx: https://nodejs.org/"
+            exit 1
+        fi
     
-    # Check for Claude CLI
-    if ! command -v claude &> /dev/null; then
-        echo -e "${YELLOW}Warning: Claude CLI not found. Install for full functionality.${NC}"
-        echo -e "See https://github.com/anthropics/claude-cli for installation instructions."
-    fi
+        # Check for Claude CLI
+        if ! command -v claude &> /dev/null; then
+            echo -e "${YELLOW}Warning: Claude CLI not found. Install for full functionality.${NC}"
+            echo -e "See https://github.com/anthropics/claude-cli for installation instructions."
+        fi
     
-    # Check for jq
-    if ! command -v jq &> /dev/null; then
-        echo -e "${YELLOW}Warning: jq is not installed. This script works best with jq for JSON parsing.${NC}"
-        echo -e "Install jq with: brew install jq (macOS) or apt-get install jq (Linux)"
+        # Check for jq
+        if ! command -v jq &> /dev/null; then
+            echo -e "${YELLOW}Warning: jq is not installed. This script works best with jq for JSON parsing.${NC}"
+            echo -e "Install jq with: brew install jq (macOS) or apt-get install jq (Linux)"
+        fi
     fi
     
     # Check for required API keys
@@ -173,8 +177,17 @@ start_server() {
         exit 1
     fi
     
+    # Read the whole server entry in a single jq pass: command, args, port,
+    # mcpName on the first four lines, followed by one KEY="value" line per env var
+    local server_config
+    server_config=$(jq -r --arg name "$server_name" '
+        .mcpServers[$name] // empty
+        | "\(.command)", ((.args // []) | join(" ")), "\(.port)", "\(.mcpName)",
+          ((.envVars // {}) | to_entries[] | "\(.key)=\"\(.value)\"")
+    ' "$CONFIG_FILE" 2>/dev/null) || true
+    
     # Check if server exists in config
-    if ! jq -e ".mcpServers.\"$server_name\"" "$CONFIG_FILE" > /dev/null 2>&1; then
+    if [ -z "$server_config" ]; then
         echo -e "${RED}Error: Server '$server_name' not found in config file.${NC}"
         return 1
     fi
@@ -189,30 +202,19 @@ start_server() {
         fi
     fi
     
-    # Get server command
-    local command
-    command=$(jq -r ".mcpServers.\"$server_name\".command" "$CONFIG_FILE")
-    command=$(resolve_env_vars "$command")
+    # Split the server entry into its fields
+    local command args port mcp_name env_vars
+    {
+        read -r command
+        read -r args
+        read -r port
+        read -r mcp_name
+        env_vars=$(cat)
+    } <<< "$server_config"
     
-    # Get server args
-    local args
-    args=$(jq -r ".mcpServers.\"$server_name\".args | join(\" \")" "$CONFIG_FILE")
+    command=$(resolve_env_vars "$command")
     args=$(resolve_env_vars "$args")
     
-    # Get environment variables
-    local env_vars
-    if jq -e ".mcpServers.\"$server_name\".envVars" "$CONFIG_FILE" > /dev/null 2>&1; then
-        env_vars=$(jq -r ".mcpServers.\"$server_name\".envVars | to_entries[] | \"\(.key)=\\\"\(.value)\\\"\"" "$CONFIG_FILE")
-    fi
-    
-    # Get port
-    local port
-    port=$(jq -r ".mcpServers.\"$server_name\".port" "$CONFIG_FILE")
-    
-    # Get MCP name
-    local mcp_name
-    mcp_name=$(jq -r ".mcpServers.\"$server_name\".mcpName" "$CONFIG_FILE")
-    
     # Create a unique log file for this server
     local log_file="$LOG_DIR/${server_name}.log"
     
@@ -407,13 +409,18 @@ check_status() {
     # Check Claude MCP list
     if command -v claude &> /dev/null; then
         echo -e "\n${BOLD}Claude MCP Servers:${NC}"
-        claude mcp list || echo -e "${YELLOW}Failed to get Claude MCP list${NC}"
+        
+        # Fetch the list once; it is reused for the registration checks below
+        local claude_mcp_list
+        if claude_mcp_list=$(claude mcp list); then
+            echo "$claude_mcp_list"
+        else
+            echo -e "${YELLOW}Failed to get Claude MCP list${NC}"
+        fi
         
         # Check for potential issues with Claude MCP registration
         if [ "$any_running" = true ]; then
             echo -e "\n${BOLD}Verifying Claude MCP registrations:${NC}"
-            local claude_mcps
-            claude_mcps=$(claude mcp list 2>/dev/null | grep -o 'Name: [^ ]*' | cut -d' ' -f2)
             
             while IFS= read -r server; do
                 if [ -n "$server" ]; then
@@ -427,7 +434,7 @@ check_status() {
                     
                     if [ -n "$pid" ] && ps -p "$pid" > /dev/null 2>&1; then
                         # Just check if the MCP name exists in the list
-                        if ! claude mcp list 2>/dev/null | grep -q "$mcp_name"; then
+                        if ! grep -q "$mcp_name" <<< "$claude_mcp_list"; then
                             echo -e "${YELLOW}Warning: ${server} is running but not registered with Claude. Run '${BOLD}./mcp_manager.sh restart${NC}${YELLOW}' to fix.${NC}"
                         fi
                     fi
@@ -1,9 +1,12 @@
 console.log('Test server starting...');
 const http = require('http');
+const body = Buffer.from(JSON.stringify({status: 'ok', server: 'test-mcp'}));
+const headers = {'Content-Type': 'application/json', 'Content-Length': body.length};
 const server = http.createServer((req, res) => {
-  res.writeHead(200, {'Content-Type': 'application/json'});
-  res.end(JSON.stringify({status: 'ok', server: 'test-mcp'}));
+  res.writeHead(200, headers);
+  res.end(body);
 });
+server.keepAliveTimeout = 30000;
 server.listen(3099, () => console.log('Test server running on port 3099'));
 process.on('SIGINT', () => {
   console.log('Test server stopping...');